@@ -4,7 +4,7 @@ import hashlib
 import json
 import logging
 from typing import Any, Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import yaml
 
 # Configure logging
@@ -31,9 +31,7 @@ def validate_config(config: Dict[str, Any], required_fields: List[str]) -> bool:
 
 def format_timestamp(timestamp: Optional[datetime] = None) -> str:
     """Format timestamp for metadata."""
-    if timestamp is None:
-        timestamp = datetime.utcnow()
-    return timestamp.isoformat()
+    return (timestamp or datetime.now(timezone.utc)).isoformat()
 
 def merge_metadata(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
     """Merge new metadata with existing metadata."""
@@ -46,7 +44,7 @@ def merge_metadata(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, A
     return merged
 
 def sanitize_entity_id(entity_id: str) -> str:
-    """Sanitize entity ID to ensure it's valid."""
+    """Sanitize entity ID by lowercasing it and mapping spaces and hyphens to underscores."""
     return entity_id.lower().replace(' ', '_').replace('-', '_')
 
 def get_platform_config(platform: str, config_path: str) -> Dict[str, Any]:
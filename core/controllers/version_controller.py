@@ -11,6 +11,9 @@ def run_version_update():
     1. Scans all datasets from DataHub
     2. Increments cloud and schema versions
     3. Updates DataHub properties
+
+    Returns:
+        Summary dict with total, succeeded and failed dataset counts.
     """
     print("🚀 Starting DataHub Version Update")
     print("=" * 50)
@@ -27,7 +30,7 @@ def run_version_update():
     
     if not datasets:
         print("❌ No datasets found in DataHub")
-        return
+        return {"total": 0, "succeeded": 0, "failed": 0}
     
     # Show platform breakdown
     platform_summary = dataset_scanner.get_platform_summary(datasets)
@@ -51,6 +54,8 @@ def run_version_update():
     print(f"❌ Failed: {failure_count}")
     print("🎉" + "=" * 50 + "🎉")
 
+    return {"total": len(datasets), "succeeded": success_count, "failed": failure_count}
+
 
 def run_dataset_scan():
     """
@@ -60,6 +65,9 @@ def run_dataset_scan():
     1. Discovers all datasets from DataHub
     2. Shows platform breakdown  
     3. Displays summary information
+
+    Returns:
+        Summary dict with the total dataset count and per-platform counts.
     """
     print("🔍 Starting DataHub Dataset Scan")
     print("=" * 50)
@@ -73,7 +81,7 @@ def run_dataset_scan():
     
     if not datasets:
         print("❌ No datasets found in DataHub")
-        return
+        return {"total": 0, "platforms": {}}
     
     # Show results
     platform_summary = dataset_scanner.get_platform_summary(datasets)
@@ -92,4 +100,6 @@ def run_dataset_scan():
     if len(datasets) > 5:
         print(f"  ... and {len(datasets) - 5} more datasets")
     
-    print("\n✅ Dataset scan complete")
\ No newline at end of file
+    print("\n✅ Dataset scan complete")
+
+    return {"total": len(datasets), "platforms": platform_summary}
@@ -15,8 +15,9 @@ class PlatformFactory:
     def get_instance(platform: str, config_manager: ConfigManager) -> MetadataPlatformInterface:
         platform_lower = platform.lower()
 
-        if platform_lower in PlatformFactory._instances:
-            return PlatformFactory._instances[platform_lower]
+        instance = PlatformFactory._instances.get(platform_lower)
+        if instance is not None:
+            return instance
 
         handler_class = PlatformFactory._handler_registry.get(platform_lower)
         if not handler_class:
@@ -1,5 +1,11 @@
 # Service for DQ assertions
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class AssertionService:
     def assert_quality(self, dataset_urn, assertion):
-        print(f"Asserting {assertion} on {dataset_urn}")
\ No newline at end of file
+        message = f"Asserting {assertion} on {dataset_urn}"
+        logger.info(message)
+        return message
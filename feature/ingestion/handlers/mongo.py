@@ -18,8 +18,8 @@ logger = logging.getLogger(__name__)
 class MongoIngestionHandler(BaseIngestionHandler):
     """Handler for MongoDB ingestion."""
 
-    def __init__(self, config, platform_handler):
-        super().__init__(config, platform_handler)
+    def __init__(self, config):
+        super().__init__(config)
         # Override required fields for MongoDB, which doesn't use a 'path'
         self.required_fields = ["type", "uri", "database", "collection", "dataset_name"]
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class DataJobService:
     """Service to manage data job lineage and metadata."""
 
+    __slots__ = ("platform_handler", "config_manager", "env")
+
     def __init__(self, platform_handler: MetadataPlatformInterface, config_manager: ConfigManager):
         self.platform_handler = platform_handler
         self.config_manager = config_manager
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from core.common.config_manager import ConfigManager
 from core.platform.interface import MetadataPlatformInterface
@@ -23,6 +23,8 @@ class DatasetLineageService:
     SRP: Its responsibility is to handle business logic related to dataset lineage.
     """
 
+    __slots__ = ("platform_handler", "config_manager", "env", "_urn_cache")
+
     def __init__(self, platform_handler: MetadataPlatformInterface, config_manager: ConfigManager):
         """
         Initializes the service with a platform handler and config manager.
@@ -31,12 +33,18 @@ class DatasetLineageService:
         self.platform_handler = platform_handler
         self.config_manager = config_manager
         self.env = self.config_manager.get_global_config().get("default_env", "PROD")
+        # Column lineage rebuilds the same dataset URNs once per field, and the env is fixed.
+        self._urn_cache: Dict[Tuple[str, str], str] = {}
 
     def _build_urn(self, data_type: str, dataset_name: str) -> str:
         """Builds a full dataset URN from a platform and name."""
         if not all([data_type, dataset_name]):
             raise ValueError("Both 'data_type' and 'dataset' must be provided.")
-        return make_dataset_urn(data_type, dataset_name, self.env)
+        key = (data_type, dataset_name)
+        urn = self._urn_cache.get(key)
+        if urn is None:
+            urn = self._urn_cache[key] = make_dataset_urn(data_type, dataset_name, self.env)
+        return urn
 
     def add_lineage_from_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -1,5 +1,11 @@
 # Service for DataHub RBAC policy management
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class PolicyService:
     def apply_policy(self, policy):
-        print(f"Applying policy: {policy}")
\ No newline at end of file
+        message = f"Applying policy: {policy}"
+        logger.info(message)
+        return message
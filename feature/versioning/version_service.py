@@ -37,11 +37,11 @@ class VersionManager:
         self.cloud_prefix = self.version_config.get("cloud_version_prefix", "S-")
         self.initial_cloud = self.version_config.get("initial_cloud_version", "S-311")
         self.initial_schema = self.version_config.get("initial_schema_version", "1.0.0")
+        self._cloud_version_re = re.compile(rf"^{re.escape(self.cloud_prefix)}\d+$")
     
     def validate_cloud_version(self, version: str) -> bool:
         """Validate cloud version format"""
-        pattern = rf"^{re.escape(self.cloud_prefix)}\d+$"
-        return bool(re.match(pattern, version))
+        return bool(self._cloud_version_re.match(version))
     
     def parse_cloud_version(self, version: str) -> Tuple[str, int]:
         """Parse cloud version into prefix and number"""
@@ -1,6 +1,7 @@
 # framework_cli.py
 import argparse
 import logging
+from typing import List, Optional
 from core.controllers import ingestion_controller, lineage_controller, data_job_lineage_controller, enrichment_controller, version_controller, ownership_controller
 from feature.extraction.extraction_factory import ExtractionFactory
 from feature.extraction.export.excel_exporter import ExcelExporter
@@ -11,7 +12,7 @@ from core.common.config_manager import ConfigManager
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="🚀 DataHub Framework CLI v2.0.0 - Comprehensive Data Management Toolkit",
         epilog="""
@@ -92,7 +93,7 @@ def main():
         version="🚀 DataHub Framework CLI v2.0.0\n📅 Built: 2025-08-21\n🏢 Enterprise Data Management Toolkit"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     for op_config in args.operations:
         try:
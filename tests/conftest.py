@@ -104,5 +104,3 @@ _ensure_optional_deps_importable()
 _stub_legacy_core_common_emitter_deps()
 _ensure_emitter_aliases()
 _alias_incorrect_core_imports()
-
-
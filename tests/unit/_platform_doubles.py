@@ -0,0 +1,47 @@
+"""Hand-rolled platform and config doubles shared by the unit tests."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from core.platform.interface import MetadataPlatformInterface
+
+
+class DummyConfigManager:
+    """Minimal config manager exposing only get_global_config."""
+
+    def get_global_config(self):
+        # Built per call: IngestionService writes the sink env into the datahub section.
+        return {"default_env": "DEV", "datahub": {}}
+
+
+class DummyPlatformHandler:
+    """Platform handler that records emitted MCPs instead of sending them."""
+
+    def __init__(self) -> None:
+        self.mcps = []
+
+    def emit_mcp(self, mcp) -> None:
+        self.mcps.append(mcp)
+
+
+class CapturingPlatform(MetadataPlatformInterface):
+    """Full MetadataPlatformInterface that records everything it is asked to emit."""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.mces: List[Any] = []
+        self.mcps: List[Any] = []
+        self.lineage: List[tuple] = []
+
+    def emit_mce(self, mce: Any) -> None:
+        self.mces.append(mce)
+
+    def emit_mcp(self, mcp: Any) -> None:
+        self.mcps.append(mcp)
+
+    def add_lineage(self, upstream_urn: str, downstream_urn: str) -> bool:
+        self.lineage.append((upstream_urn, downstream_urn))
+        return True
+
+    def get_aspect_for_urn(self, urn: str, aspect_name: str) -> Optional[Any]:
+        return None
@@ -0,0 +1,126 @@
+"""Shared fixtures for unit tests."""
+from __future__ import annotations
+
+import json
+import re
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import pytest
+
+from _platform_doubles import CapturingPlatform, DummyConfigManager, DummyPlatformHandler
+
+
+@pytest.fixture(scope="session")
+def dummy_config_manager() -> DummyConfigManager:
+    """Shared config double; stateless, so one instance serves the whole session."""
+    return DummyConfigManager()
+
+
+@pytest.fixture
+def ingestion_service(dummy_config_manager):
+    """IngestionService wired to the shared config manager and a mock platform handler."""
+    from feature.ingestion.ingestion_service import IngestionService
+
+    return IngestionService(config_manager=dummy_config_manager, platform_handler=MagicMock())
+
+
+@pytest.fixture(scope="session")
+def sample_csv_config() -> MappingProxyType:
+    """Read-only handler config shared across the session; copy it before mutating."""
+    return MappingProxyType(
+        {
+            "source": MappingProxyType(
+                {
+                    "type": "csv",
+                    "path": "/tmp/sample.csv",
+                    "dataset_name": "sample",
+                    "schema": MappingProxyType({"id": "int", "name": "string"}),
+                }
+            ),
+            "sink": MappingProxyType({"env": "DEV"}),
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_csv_bytes() -> bytes:
+    """Canonical three-column CSV payload, built once per session."""
+    return b"id,name,value\n1,test,100\n2,foo,200\n"
+
+
+@pytest.fixture
+def sample_csv_path(tmp_path, sample_csv_bytes):
+    """The canonical CSV written into this test's own tmp_path."""
+    path = tmp_path / "data.csv"
+    path.write_bytes(sample_csv_bytes)
+    return path
+
+
+def _write_ingestion_config(directory, name: str, configs) -> str:
+    path = directory / name
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(configs, f)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def single_bad_cfg(tmp_path_factory) -> str:
+    """Ingestion config file whose only entry points at a missing CSV."""
+    return _write_ingestion_config(
+        tmp_path_factory.mktemp("ingestion"),
+        "single.json",
+        [{"source_type": "csv", "source_path": "/nope.csv"}],
+    )
+
+
+@pytest.fixture(scope="session")
+def multi_bad_cfg(tmp_path_factory) -> str:
+    """Ingestion config file with two entries that both point at missing files."""
+    return _write_ingestion_config(
+        tmp_path_factory.mktemp("ingestion"),
+        "multi.json",
+        [
+            {"source_type": "csv", "source_path": "/nope.csv"},
+            {"source_type": "parquet", "source_path": "/nope.parquet"},
+        ],
+    )
+
+
+GMS_URL = "http://localhost:8080"
+# Pre-serialised cloud_version custom property, exactly as GMS stores it.
+_CLOUD_VERSION_JSON = '{"S-311": "1.0.0"}'
+
+
+@pytest.fixture
+def gms(requests_mock):
+    """Fake DataHub GMS: every GET returns a dataset snapshot with a cloud_version mapping."""
+    requests_mock.get(
+        re.compile(re.escape(GMS_URL) + r"/.*"),
+        json={
+            "value": {
+                "com.linkedin.metadata.snapshot.DatasetSnapshot": {
+                    "aspects": [
+                        {
+                            "com.linkedin.dataset.DatasetProperties": {
+                                "customProperties": {"cloud_version": _CLOUD_VERSION_JSON}
+                            }
+                        }
+                    ]
+                }
+            }
+        },
+    )
+    return requests_mock
+
+
+@pytest.fixture
+def dummy_platform_handler() -> DummyPlatformHandler:
+    """Fresh per test so ``mcps`` only holds that test's emissions."""
+    return DummyPlatformHandler()
+
+
+@pytest.fixture
+def capturing_platform() -> CapturingPlatform:
+    """Fresh recording platform per test."""
+    return CapturingPlatform({})
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
+import yaml
+
 from core.common.config_manager import ConfigManager
 
 
@@ -16,16 +20,19 @@ def test_load_config_non_dict_yaml_returns_empty_dict(tmp_path) -> None:
     assert cm.load_config(str(cfg)) == {}
 
 
-def test_load_config_valid_yaml_is_cached_by_resolved_path(tmp_path) -> None:
+def test_load_config_valid_yaml_is_cached_by_resolved_path(tmp_path, monkeypatch) -> None:
+    spy = MagicMock(wraps=yaml.safe_load)
+    monkeypatch.setattr("core.common.config_manager.yaml.safe_load", spy)
     cm = ConfigManager(base_config_dir=str(tmp_path))
     cfg = tmp_path / "cfg.yaml"
     cfg.write_text("a: 1\nb: 2\n", encoding="utf-8")
 
     first = cm.load_config(str(cfg))
-    second = cm.load_config(str(cfg))
+    second = cm.load_config(f"{tmp_path}/./cfg.yaml")
 
     assert first is second
     assert first == {"a": 1, "b": 2}
+    assert spy.call_count == 1
 
 
 def test_get_global_config_reads_from_base_config_dir(tmp_path) -> None:
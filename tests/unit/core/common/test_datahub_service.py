@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+datahub_service = pytest.importorskip("core.platform.impl.datahub_service")
+
+
+def test_datahub_data_catalog_delegates_to_emitter(monkeypatch) -> None:
+    emitter = MagicMock()
+    monkeypatch.setattr(datahub_service, "DatahubRestEmitter", MagicMock(return_value=emitter))
+
+    catalog = datahub_service.DataHubDataCatalog("http://localhost:8080")
+    catalog.emit("mce")
+    catalog.emit_mcp("mcp")
+
+    datahub_service.DatahubRestEmitter.assert_called_once_with(gms_server="http://localhost:8080")
+    emitter.emit.assert_called_once_with("mce")
+    emitter.emit_mcp.assert_called_once_with("mcp")
+    assert catalog.get_emitter() is emitter
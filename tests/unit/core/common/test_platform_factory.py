@@ -1,9 +1,19 @@
 """Unit tests for platform factory."""
 from __future__ import annotations
 
+from types import MappingProxyType
+from types import SimpleNamespace as NS
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+# PlatformFactory._instances is a process-wide cache these tests clear and
+# refill, so keep the whole module on a single xdist worker.
+pytestmark = pytest.mark.xdist_group("platform_factory")
+
+# Test-mode datahub settings shared by the factory and handler tests.
+_DATAHUB_CFG = MappingProxyType({"gms_server": "http://localhost:8080", "test_mode": True})
+
 
 def test_platform_factory_import() -> None:
     """Test that PlatformFactory can be imported."""
@@ -11,40 +21,53 @@ def test_platform_factory_import() -> None:
     assert PlatformFactory is not None
 
 
-def test_platform_factory_get_instance_datahub(tmp_path) -> None:
+@pytest.fixture(autouse=True)
+def _reset_platform_factory():
+    """Start every test with an empty PlatformFactory instance cache.
+
+    The cache is snapshotted and restored afterwards, so handlers cached by
+    other modules survive these tests.
+    """
+    from core.platform.factory import PlatformFactory
+
+    saved = dict(PlatformFactory._instances)
+    PlatformFactory._instances.clear()
+    yield
+    PlatformFactory._instances.clear()
+    PlatformFactory._instances.update(saved)
+
+
+@pytest.fixture(scope="module")
+def datahub_config_manager(tmp_path_factory):
+    """ConfigManager reading a global_settings.yaml with a test-mode datahub section."""
+    import yaml
+
+    from core.common.config_manager import ConfigManager
+
+    config_dir = tmp_path_factory.mktemp("datahub_settings")
+    (config_dir / "global_settings.yaml").write_text(
+        yaml.safe_dump({"datahub": dict(_DATAHUB_CFG)})
+    )
+    return ConfigManager(base_config_dir=str(config_dir))
+
+
+def test_platform_factory_get_instance_datahub(datahub_config_manager) -> None:
     """Test factory creates DataHub handler for 'datahub' platform."""
     from core.platform.factory import PlatformFactory
     from core.platform.impl.datahub_handler import DataHubHandler
-    from core.common.config_manager import ConfigManager
-    
-    # Create a temp config file
-    config_file = tmp_path / "global_settings.yaml"
-    config_file.write_text("datahub:\n  gms_server: http://localhost:8080\n  test_mode: true\n")
-    
-    config_manager = ConfigManager(base_config_dir=str(tmp_path))
-    
-    # Clear the instances cache to ensure a fresh handler is created
-    PlatformFactory._instances.clear()
-    
-    handler = PlatformFactory.get_instance("datahub", config_manager)
+
+    handler = PlatformFactory.get_instance("datahub", datahub_config_manager)
     assert isinstance(handler, DataHubHandler)
 
 
-def test_platform_factory_caches_instance(tmp_path) -> None:
-    """Test factory caches handler instances."""
+@pytest.mark.parametrize("second_name", ["datahub", "DataHub"], ids=["same_case", "mixed_case"])
+def test_platform_factory_caches_instance(datahub_config_manager, second_name) -> None:
+    """Test factory caches handler instances under a case-insensitive platform key."""
     from core.platform.factory import PlatformFactory
-    from core.common.config_manager import ConfigManager
-    
-    config_file = tmp_path / "global_settings.yaml"
-    config_file.write_text("datahub:\n  gms_server: http://localhost:8080\n  test_mode: true\n")
-    
-    config_manager = ConfigManager(base_config_dir=str(tmp_path))
-    
-    PlatformFactory._instances.clear()
-    
-    handler1 = PlatformFactory.get_instance("datahub", config_manager)
-    handler2 = PlatformFactory.get_instance("datahub", config_manager)
-    
+
+    handler1 = PlatformFactory.get_instance("datahub", datahub_config_manager)
+    handler2 = PlatformFactory.get_instance(second_name, datahub_config_manager)
+
     assert handler1 is handler2
 
 
@@ -58,8 +81,6 @@ def test_platform_factory_unknown_platform_raises_error(tmp_path) -> None:
     
     config_manager = ConfigManager(base_config_dir=str(tmp_path))
     
-    PlatformFactory._instances.clear()
-    
     with pytest.raises(ValueError):
         PlatformFactory.get_instance("unknown_platform", config_manager)
 
@@ -74,30 +95,27 @@ def test_platform_factory_missing_config_raises_error(tmp_path) -> None:
     
     config_manager = ConfigManager(base_config_dir=str(tmp_path))
     
-    PlatformFactory._instances.clear()
-    
     with pytest.raises(ValueError):
         PlatformFactory.get_instance("datahub", config_manager)
 
 
 class TestDataHubHandler:
     """Tests for DataHubHandler."""
+
+    @pytest.fixture(scope="class")
+    def handler(self):
+        """A test-mode DataHubHandler shared by every test in this class."""
+        from core.platform.impl.datahub_handler import DataHubHandler
+
+        return DataHubHandler(dict(_DATAHUB_CFG))
     
     def test_datahub_handler_import(self) -> None:
         """Test that DataHubHandler can be imported."""
         from core.platform.impl.datahub_handler import DataHubHandler
         assert DataHubHandler is not None
     
-    def test_datahub_handler_test_mode_initialization(self) -> None:
+    def test_datahub_handler_test_mode_initialization(self, handler) -> None:
         """Test DataHubHandler initialization in test mode."""
-        from core.platform.impl.datahub_handler import DataHubHandler
-        
-        config = {
-            "gms_server": "http://localhost:8080",
-            "test_mode": True
-        }
-        
-        handler = DataHubHandler(config)
         assert handler.test_mode is True
         assert handler._emitter is None
     
@@ -112,17 +130,8 @@ class TestDataHubHandler:
         with pytest.raises(ValueError):
             DataHubHandler(config)
     
-    def test_datahub_handler_emit_mce_test_mode(self) -> None:
+    def test_datahub_handler_emit_mce_test_mode(self, handler) -> None:
         """Test emit_mce in test mode logs instead of emitting."""
-        from core.platform.impl.datahub_handler import DataHubHandler
-        
-        config = {
-            "gms_server": "http://localhost:8080",
-            "test_mode": True
-        }
-        
-        handler = DataHubHandler(config)
-        
         # Create a mock MCE
         mock_mce = MagicMock()
         mock_mce.proposedSnapshot.urn = "urn:li:dataset:(urn:li:dataPlatform:csv,test,DEV)"
@@ -131,17 +140,8 @@ class TestDataHubHandler:
         # Should not raise in test mode
         handler.emit_mce(mock_mce)
     
-    def test_datahub_handler_emit_mcp_test_mode(self) -> None:
+    def test_datahub_handler_emit_mcp_test_mode(self, handler) -> None:
         """Test emit_mcp in test mode logs instead of emitting."""
-        from core.platform.impl.datahub_handler import DataHubHandler
-        
-        config = {
-            "gms_server": "http://localhost:8080",
-            "test_mode": True
-        }
-        
-        handler = DataHubHandler(config)
-        
         # Create a mock MCP
         mock_mcp = MagicMock()
         mock_mcp.entityUrn = "urn:li:dataset:(urn:li:dataPlatform:csv,test,DEV)"
@@ -151,17 +151,8 @@ class TestDataHubHandler:
         # Should not raise in test mode
         handler.emit_mcp(mock_mcp)
     
-    def test_datahub_handler_add_lineage_test_mode(self) -> None:
+    def test_datahub_handler_add_lineage_test_mode(self, handler) -> None:
         """Test add_lineage in test mode."""
-        from core.platform.impl.datahub_handler import DataHubHandler
-        
-        config = {
-            "gms_server": "http://localhost:8080",
-            "test_mode": True
-        }
-        
-        handler = DataHubHandler(config)
-        
         upstream = "urn:li:dataset:(urn:li:dataPlatform:csv,source,DEV)"
         downstream = "urn:li:dataset:(urn:li:dataPlatform:csv,target,DEV)"
         
@@ -169,6 +160,44 @@ class TestDataHubHandler:
         result = handler.add_lineage(upstream, downstream)
         assert result is True
 
+    def test_get_aspect_for_urn_returns_none_on_exception(self, handler, monkeypatch) -> None:
+        """Test get_aspect_for_urn swallows emitter errors and returns None."""
+        # monkeypatch restores test_mode so the shared handler stays in test mode
+        monkeypatch.setattr(handler, "test_mode", False)
+        monkeypatch.setattr(handler, "_emitter", MagicMock())
+        handler._emitter.get_latest_aspect_or_null.side_effect = RuntimeError("boom")
+
+        urn = "urn:li:dataset:(urn:li:dataPlatform:csv,test,DEV)"
+        assert handler.get_aspect_for_urn(urn, "upstreamLineage") is None
+
+    def test_convert_aspect_to_dict_schema_like_object(self, handler) -> None:
+        """Test _convert_aspect_to_dict flattens schema-like aspects into plain dicts."""
+        def field(path):
+            return NS(
+                fieldPath=path,
+                nativeDataType="string",
+                type=NS(type=NS()),
+                nullable=True,
+                recursive=False,
+                isPartOfKey=False,
+            )
+
+        aspect = NS(
+            schemaName="s",
+            platform="p",
+            version=1,
+            hash="h",
+            platformSchema=NS(rawSchema="raw"),
+            fields=[field("a"), field("b")],
+        )
+
+        result = handler._convert_aspect_to_dict(aspect)
+
+        assert [f["fieldPath"] for f in result["fields"]] == ["a", "b"]
+        assert result["fields"][0]["nullable"] is True
+        assert result["schemaName"] == "s"
+        assert result["platformSchema"] == {"rawSchema": "raw"}
+
 
 class TestMetadataPlatformInterface:
     """Tests for MetadataPlatformInterface."""
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import pytest
+
 from core.common import utils
 
 
@@ -37,6 +39,7 @@ def test_validate_config_checks_required_fields() -> None:
 def test_format_timestamp_defaults_to_isoformat() -> None:
     ts = utils.format_timestamp()
     assert "T" in ts  # isoformat
+    assert ts.endswith("+00:00")  # current time is taken in UTC
 
 
 def test_format_timestamp_uses_provided_datetime() -> None:
@@ -62,8 +65,18 @@ def test_merge_metadata_overwrites_when_not_both_dicts() -> None:
     assert merged["a"] == 3
 
 
-def test_sanitize_entity_id_normalizes_case_and_separators() -> None:
-    assert utils.sanitize_entity_id("My-Entity Id") == "my_entity_id"
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("My-Entity Id", "my_entity_id"),
+        # Only spaces and hyphens are mapped: runs are kept and other characters pass through.
+        ("a  b--c", "a__b__c"),
+        ("db.schema_Table", "db.schema_table"),
+    ],
+    ids=["case_and_separators", "runs_not_collapsed", "other_chars_kept"],
+)
+def test_sanitize_entity_id_normalizes_case_and_separators(raw: str, expected: str) -> None:
+    assert utils.sanitize_entity_id(raw) == expected
 
 
 def test_get_platform_config_missing_returns_empty_dict(tmp_path) -> None:
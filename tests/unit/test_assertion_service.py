@@ -0,0 +1,14 @@
+"""Unit tests for AssertionService."""
+from __future__ import annotations
+
+import logging
+
+from feature.dq_services.assertion_service import AssertionService
+
+
+def test_assert_quality_returns_and_logs_message(caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="feature.dq_services.assertion_service"):
+        message = AssertionService().assert_quality("urn:li:dataset:x", "not_null")
+
+    assert message == "Asserting not_null on urn:li:dataset:x"
+    assert message in caplog.text
@@ -1,4 +1,4 @@
-import unittest
+import pytest
 
 from scripts.conventions import (
     extract_issue_refs,
@@ -8,82 +8,73 @@ from scripts.conventions import (
 )
 
 
-class TestConventions(unittest.TestCase):
-    def test_validate_branch_name_allows_default_branches(self) -> None:
-        for branch in ("main", "master", "develop"):
-            with self.subTest(branch=branch):
-                res = validate_branch_name(branch)
-                self.assertTrue(res.ok, res.message)
-
-    def test_validate_branch_name_allows_dependabot_branches(self) -> None:
-        res = validate_branch_name("dependabot/pip/requests-2.32.3")
-        self.assertTrue(res.ok, res.message)
-
-    def test_validate_branch_name_allows_valid_format(self) -> None:
-        for branch in (
-            "feature/19-link-issues-to-prs",
-            "fix/15-ingestion-status-message",
-            "docs/8-update-readme",
-            "chore/16-bump-upload-artifact",
-            "refactor/21-cleanup",
-            "test/17-add-tests",
-        ):
-            with self.subTest(branch=branch):
-                res = validate_branch_name(branch)
-                self.assertTrue(res.ok, res.message)
-
-    def test_validate_branch_name_rejects_missing_issue_number(self) -> None:
-        for branch in ("feature/new-handler", "fix/bug-123", "docs/update-readme"):
-            with self.subTest(branch=branch):
-                res = validate_branch_name(branch)
-                self.assertFalse(res.ok)
-
-    def test_validate_branch_name_rejects_invalid_slug_chars(self) -> None:
-        res = validate_branch_name("feature/19_bad_slug")
-        self.assertFalse(res.ok)
-
-    def test_validate_conventional_subject_accepts_valid(self) -> None:
-        res = validate_conventional_subject("chore(conventions): enforce issue linking (#19)")
-        self.assertTrue(res.ok, res.message)
-
-    def test_validate_conventional_subject_rejects_invalid(self) -> None:
-        res = validate_conventional_subject("Update code")
-        self.assertFalse(res.ok)
-
-    def test_extract_issue_refs(self) -> None:
-        refs = extract_issue_refs("Closes #19. Related: owner/repo#20. Not: abc#1.")
-        self.assertEqual(refs, {19, 20})
-
-    def test_pr_body_links_issue_success(self) -> None:
-        res = validate_pr_body_links_issue(
-            "This implements the checks.\n\nCloses #19\n",
-            branch_name="feature/19-link-issues-to-prs",
-            actor="goyal-chintan",
-        )
-        self.assertTrue(res.ok, res.message)
-
-    def test_pr_body_links_issue_rejects_missing_ref(self) -> None:
-        res = validate_pr_body_links_issue(
-            "This implements the checks.\n",
-            branch_name="feature/19-link-issues-to-prs",
-            actor="goyal-chintan",
-        )
-        self.assertFalse(res.ok)
-
-    def test_pr_body_links_issue_rejects_wrong_issue(self) -> None:
-        res = validate_pr_body_links_issue(
-            "Closes #18\n",
-            branch_name="feature/19-link-issues-to-prs",
-            actor="goyal-chintan",
-        )
-        self.assertFalse(res.ok)
-
-    def test_pr_body_links_issue_exempts_dependabot(self) -> None:
-        res = validate_pr_body_links_issue(
-            "",
-            branch_name="dependabot/pip/requests-2.32.3",
-            actor="dependabot[bot]",
-        )
-        self.assertTrue(res.ok, res.message)
+@pytest.mark.parametrize("branch", ["main", "master", "develop"])
+def test_validate_branch_name_allows_default_branches(branch: str) -> None:
+    res = validate_branch_name(branch)
+    assert res.ok, res.message
 
 
+def test_validate_branch_name_allows_dependabot_branches() -> None:
+    res = validate_branch_name("dependabot/pip/requests-2.32.3")
+    assert res.ok, res.message
+
+
+@pytest.mark.parametrize(
+    "branch",
+    [
+        "feature/19-link-issues-to-prs",
+        "fix/15-ingestion-status-message",
+        "docs/8-update-readme",
+        "chore/16-bump-upload-artifact",
+        "refactor/21-cleanup",
+        "test/17-add-tests",
+    ],
+)
+def test_validate_branch_name_allows_valid_format(branch: str) -> None:
+    res = validate_branch_name(branch)
+    assert res.ok, res.message
+
+
+@pytest.mark.parametrize(
+    "branch",
+    [
+        "feature/new-handler",
+        "fix/bug-123",
+        "docs/update-readme",
+        "feature/19_bad_slug",
+    ],
+)
+def test_validate_branch_name_rejects_invalid(branch: str) -> None:
+    assert not validate_branch_name(branch).ok
+
+
+def test_validate_conventional_subject_accepts_valid() -> None:
+    res = validate_conventional_subject("chore(conventions): enforce issue linking (#19)")
+    assert res.ok, res.message
+
+
+def test_validate_conventional_subject_rejects_invalid() -> None:
+    assert not validate_conventional_subject("Update code").ok
+
+
+def test_extract_issue_refs() -> None:
+    refs = extract_issue_refs("Closes #19. Related: owner/repo#20. Not: abc#1.")
+    assert refs == {19, 20}
+
+
+_ISSUE_BRANCH = "feature/19-link-issues-to-prs"
+
+
+@pytest.mark.parametrize(
+    "body,branch,actor,ok",
+    [
+        ("This implements the checks.\n\nCloses #19\n", _ISSUE_BRANCH, "goyal-chintan", True),
+        ("This implements the checks.\n", _ISSUE_BRANCH, "goyal-chintan", False),
+        ("Closes #18\n", _ISSUE_BRANCH, "goyal-chintan", False),
+        ("", "dependabot/pip/requests-2.32.3", "dependabot[bot]", True),
+    ],
+    ids=["links_issue", "missing_ref", "wrong_issue", "dependabot_exempt"],
+)
+def test_pr_body_links_issue(body: str, branch: str, actor: str, ok: bool) -> None:
+    res = validate_pr_body_links_issue(body, branch_name=branch, actor=actor)
+    assert res.ok is ok, res.message
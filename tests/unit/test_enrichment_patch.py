@@ -0,0 +1,76 @@
+"""Unit tests for the metadata patches emitted by enrichment services."""
+from __future__ import annotations
+
+import pytest
+
+from feature.enrichment.description_service import DescriptionService
+from feature.enrichment.documentation_service import DocumentationService
+from feature.enrichment.properties_service import PropertiesService
+from feature.enrichment.tag_service import TagService
+
+_TARGET = {"data_type": "csv", "dataset_name": "orders"}
+_TARGET_URN = "urn:li:dataset:(urn:li:dataPlatform:csv,orders,DEV)"
+
+
+@pytest.fixture(scope="session")
+def change_type_class():
+    """Resolve ChangeTypeClass once, only for the tests that inspect changeType."""
+    from datahub.metadata.schema_classes import ChangeTypeClass
+
+    return ChangeTypeClass
+
+
+@pytest.mark.slow
+def test_description_service_emits_upsert(
+    dummy_platform_handler, dummy_config_manager, change_type_class
+) -> None:
+    service = DescriptionService(dummy_platform_handler, dummy_config_manager)
+
+    assert service.enrich({**_TARGET, "description": "Order facts"}) is True
+
+    (mcp,) = dummy_platform_handler.mcps
+    assert mcp.entityUrn == _TARGET_URN
+    assert mcp.changeType == change_type_class.UPSERT
+    assert mcp.aspect.description == "Order facts"
+
+
+@pytest.mark.slow
+def test_tag_service_emits_tag_urns(
+    dummy_platform_handler, dummy_config_manager, change_type_class
+) -> None:
+    service = TagService(dummy_platform_handler, dummy_config_manager)
+
+    assert service.enrich({**_TARGET, "tags": ["pii", "gold"]}) is True
+
+    (mcp,) = dummy_platform_handler.mcps
+    assert mcp.changeType == change_type_class.UPSERT
+    assert [t.tag for t in mcp.aspect.tags] == ["urn:li:tag:pii", "urn:li:tag:gold"]
+
+
+def test_properties_service_emits_custom_properties(
+    dummy_platform_handler, dummy_config_manager
+) -> None:
+    service = PropertiesService(dummy_platform_handler, dummy_config_manager)
+
+    assert service.enrich({**_TARGET, "custom_properties": {"owner": "sales"}}) is True
+
+    (mcp,) = dummy_platform_handler.mcps
+    assert mcp.aspect.customProperties == {"owner": "sales"}
+
+
+def test_documentation_service_emits_link(dummy_platform_handler, dummy_config_manager) -> None:
+    service = DocumentationService(dummy_platform_handler, dummy_config_manager)
+
+    assert service.enrich({**_TARGET, "doc_url": "https://docs.example.com/orders"}) is True
+
+    (mcp,) = dummy_platform_handler.mcps
+    assert mcp.aspect.elements[0].url == "https://docs.example.com/orders"
+
+
+def test_enrich_returns_false_without_emitting_on_missing_target(
+    dummy_platform_handler, dummy_config_manager
+) -> None:
+    service = DescriptionService(dummy_platform_handler, dummy_config_manager)
+
+    assert service.enrich({"description": "x"}) is False
+    assert dummy_platform_handler.mcps == []
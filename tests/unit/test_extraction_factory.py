@@ -0,0 +1,65 @@
+"""Unit tests for ExtractionFactory."""
+from __future__ import annotations
+
+import pytest
+
+mod = pytest.importorskip("feature.extraction.extraction_factory")
+
+
+class _StubExtractor:
+    def __init__(self, config_manager) -> None:
+        self.config_manager = config_manager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_registry():
+    """Swap every registered extractor for a stub so no real extractor is constructed."""
+    stub_services = dict.fromkeys(mod.ExtractionFactory.EXTRACTION_SERVICES, _StubExtractor)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mod.ExtractionFactory, "EXTRACTION_SERVICES", stub_services)
+        mp.setattr(mod, "ComprehensiveExtractionWrapper", _StubExtractor)
+        yield
+
+
+@pytest.fixture(scope="module")
+def supported_types() -> frozenset:
+    """Supported extraction types, built once per module."""
+    return frozenset(mod.ExtractionFactory.get_supported_types())
+
+
+def test_get_supported_types_includes_comprehensive_and_known_types(supported_types) -> None:
+    assert {"comprehensive", "schema", "lineage", "governance", "metadata_diff"} <= supported_types
+
+
+def test_get_extractor_returns_none_for_unknown_type() -> None:
+    assert mod.ExtractionFactory.get_extractor("nope", config_manager=None) is None
+
+
+def test_get_extractor_returns_registered_service() -> None:
+    cm = object()
+    extractor = mod.ExtractionFactory.get_extractor("schema", cm)
+
+    assert isinstance(extractor, _StubExtractor)
+    assert extractor.config_manager is cm
+
+
+def test_get_extractor_comprehensive_uses_wrapper(monkeypatch) -> None:
+    sentinel = object()
+    monkeypatch.setattr(mod, "ComprehensiveExtractionWrapper", lambda config_manager: sentinel)
+
+    assert mod.ExtractionFactory.get_extractor("comprehensive", config_manager=None) is sentinel
+
+
+@pytest.mark.parametrize(
+    "cfg,substr",
+    [
+        ({}, "extraction_type not specified"),
+        ({"extraction_type": "nope"}, "Unsupported extraction type"),
+    ],
+    ids=["missing_type", "unsupported_type"],
+)
+def test_extract_with_config_returns_error(cfg, substr) -> None:
+    result = mod.ExtractionFactory.extract_with_config(cfg, config_manager=None)
+
+    assert result.success is False
+    assert substr in result.error_message
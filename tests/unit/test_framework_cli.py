@@ -0,0 +1,19 @@
+"""Unit tests for the framework CLI entry point."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from framework_cli import main
+
+
+def test_cli_requires_command() -> None:
+    with pytest.raises(SystemExit):
+        main([])
+
+
+def test_cli_logs_unknown_operation(caplog) -> None:
+    with caplog.at_level(logging.ERROR, logger="framework_cli"):
+        main(["bogus"])
+    assert "Unknown operation: bogus" in caplog.text
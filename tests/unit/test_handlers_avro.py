@@ -0,0 +1,78 @@
+"""Unit tests for the Avro ingestion handler."""
+from __future__ import annotations
+
+import functools
+import json
+
+import pytest
+
+fastavro = pytest.importorskip("fastavro")
+
+from datahub.metadata.schema_classes import NumberTypeClass, StringTypeClass  # noqa: E402
+
+from feature.ingestion.handlers.avro import AvroIngestionHandler  # noqa: E402
+
+_SCHEMA = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": ["null", "string"], "default": None},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+    ],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_schema():
+    return fastavro.parse_schema(_SCHEMA)
+
+
+def _create_avro(directory, dataset_name: str):
+    path = directory / f"{dataset_name}.avro"
+    with open(path, "wb") as fo:
+        fastavro.writer(fo, _parsed_schema(), [{"id": 1, "name": "a", "tags": ["x"]}])
+    return path
+
+
+@pytest.fixture(scope="module")
+def avro_dataset(tmp_path_factory):
+    """One Avro file written per module and shared by every test."""
+    return _create_avro(tmp_path_factory.mktemp("avros"), "dataset_one")
+
+
+@pytest.fixture
+def handler(avro_dataset) -> AvroIngestionHandler:
+    return AvroIngestionHandler(
+        {
+            "source": {"type": "avro", "path": str(avro_dataset), "dataset_name": "dataset_one"},
+            "sink": {"env": "DEV"},
+        }
+    )
+
+
+def test_avro_handler_maps_field_types_and_nullability(handler) -> None:
+    fields = {f.fieldPath: f for f in handler._get_schema_fields()}
+
+    assert list(fields) == ["id", "name", "tags"]
+    assert isinstance(fields["id"].type.type, NumberTypeClass)
+    assert fields["id"].nullable is False
+    assert isinstance(fields["name"].type.type, StringTypeClass)
+    assert fields["name"].nullable is True
+    assert isinstance(fields["tags"].type.type, StringTypeClass)
+
+
+def test_avro_handler_reads_schema_once(handler, monkeypatch) -> None:
+    handler._get_avro_schema()
+    monkeypatch.setattr("feature.ingestion.handlers.avro.reader", None)
+    assert handler._get_avro_schema()["name"] == "Row"
+
+
+def test_avro_handler_raw_schema_is_json(handler) -> None:
+    assert json.loads(handler._get_raw_schema())["name"] == "Row"
+
+
+@pytest.mark.slow
+def test_avro_handler_emits_mce(handler) -> None:
+    mce = handler.ingest()
+    assert mce.proposedSnapshot.urn.endswith(",dataset_one,DEV)")
@@ -0,0 +1,57 @@
+"""Unit tests for the MongoDB ingestion handler."""
+from __future__ import annotations
+
+import pymongo
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from datahub.metadata.schema_classes import NumberTypeClass, StringTypeClass  # noqa: E402
+
+from feature.ingestion.handlers.factory import HandlerFactory  # noqa: E402
+from feature.ingestion.handlers.mongo import MongoIngestionHandler  # noqa: E402
+
+_CONFIG = {
+    "source": {
+        "type": "mongodb",
+        "uri": "mongodb://localhost:27017",
+        "database": "shop",
+        "collection": "orders",
+        "dataset_name": "orders",
+    },
+    "sink": {"env": "DEV"},
+}
+
+
+@pytest.fixture(scope="session")
+def seeded_mongo():
+    """One in-memory client seeded with a sample document for the whole session."""
+    client = mongomock.MongoClient()
+    client["shop"]["orders"].insert_one({"sku": "a-1", "qty": 2, "price": 9.5})
+    return client
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mongo_patched(seeded_mongo):
+    """Route pymongo.MongoClient to the seeded client once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pymongo, "MongoClient", lambda *_a, **_k: seeded_mongo)
+        yield
+
+
+@pytest.fixture
+def mongo_handler() -> MongoIngestionHandler:
+    return HandlerFactory.get_handler(_CONFIG)
+
+
+def test_mongo_handler_infers_schema_from_sample(mongo_handler) -> None:
+    fields = {f.fieldPath: f for f in mongo_handler._get_schema_fields()}
+
+    assert {"_id", "sku", "qty", "price"} <= fields.keys()
+    assert isinstance(fields["sku"].type.type, StringTypeClass)
+    assert isinstance(fields["qty"].type.type, NumberTypeClass)
+
+
+def test_mongo_handler_emits_mce(mongo_handler) -> None:
+    mce = mongo_handler.ingest()
+    assert mce.proposedSnapshot.urn == "urn:li:dataset:(urn:li:dataPlatform:mongodb,orders,DEV)"
@@ -1,7 +1,29 @@
 from __future__ import annotations
 
+import importlib.util
+
 import pytest
 
+_KEY_MODULES = (
+    "core.common.config_manager",
+    "core.platform.factory",
+    "feature.ingestion.ingestion_service",
+    "framework_cli",
+)
+
+
+@pytest.mark.parametrize("name", _KEY_MODULES)
+def test_key_modules_are_present(name: str) -> None:
+    # Cheap presence check: locates the module without executing it
+    # (only its parent packages get imported).
+    try:
+        spec = importlib.util.find_spec(name)
+    except PermissionError as e:
+        pytest.skip(f"Skipping {name} lookup in restricted environment: {e}")
+    assert spec is not None
+
+
+@pytest.mark.slow
 def test_imports_smoke() -> None:
     # Import a few key modules to ensure the project can be imported in a clean env.
     import core.common.config_manager  # noqa: F401
@@ -13,5 +35,3 @@ def test_imports_smoke() -> None:
         pytest.skip(f"Skipping platform factory import in restricted environment: {e}")
     import feature.ingestion.ingestion_service  # noqa: F401
     import framework_cli  # noqa: F401
-
-
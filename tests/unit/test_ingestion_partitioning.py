@@ -3,28 +3,26 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
 from datahub.metadata.schema_classes import DatasetPropertiesClass
 
-from core.common.config_manager import ConfigManager
 from feature.ingestion.ingestion_service import IngestionService
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_SAMPLE_CSV_ROOT = _REPO_ROOT / "sample-data-csv"
+_PARTITION_ROOT = _SAMPLE_CSV_ROOT / "partitioned" / "categories"
 
-def _mock_config_manager(global_overrides: dict[str, Any] | None = None) -> ConfigManager:
-    config_manager = MagicMock(spec=ConfigManager)
-    config_manager.get_global_config.return_value = global_overrides or {
-        "datahub": {},
-        "default_env": "DEV",
-    }
-    return config_manager
+
+def _aspect(mce, cls):
+    """Return the aspect of exactly type ``cls`` from an emitted MCE's snapshot."""
+    return {type(aspect): aspect for aspect in mce.proposedSnapshot.aspects}[cls]
 
 
-def test_resolve_partition_path_uses_timestamp_directly() -> None:
-    service = IngestionService(_mock_config_manager(), MagicMock())
+def test_resolve_partition_path_uses_timestamp_directly(ingestion_service) -> None:
     base_path = "/tmp/data"
-    partition_info = service._resolve_partition_path(
+    partition_info = ingestion_service._resolve_partition_path(
         base_path=base_path,
         partitioning_format="year=%Y/month=%m/day=%d",
         run_dt=datetime(2024, 12, 27, 0, 30, tzinfo=timezone.utc),
@@ -35,124 +33,64 @@ def test_resolve_partition_path_uses_timestamp_directly() -> None:
     assert partition_info["values"] == {"year": "2024", "month": "12", "day": "27"}
 
 
-def test_ingestion_uses_resolved_partition_metadata(tmp_path) -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    partition_root = repo_root / "sample-data-csv" / "partitioned" / "categories"
-
-    config = [
-        {
-            "source_type": "csv",
-            "source_path": str(partition_root),
-            "partitioning_format": "year=%Y/month=%m/day=%d",
-            "partition_cron": "0 2 * * *",
-            "infer_schema": True,
-            "schema": {},
-        }
-    ]
-    config_path = tmp_path / "ingestion.json"
-    config_path.write_text(json.dumps(config), encoding="utf-8")
-
-    platform_handler = MagicMock()
-    service = IngestionService(_mock_config_manager(), platform_handler)
-
-    service.start_ingestion(str(config_path), run_timestamp="2024-12-27T00:30:00Z")
-
-    platform_handler.emit_mce.assert_called()
-    emitted_mce = platform_handler.emit_mce.call_args[0][0]
-    props_aspect = next(
-        aspect
-        for aspect in emitted_mce.proposedSnapshot.aspects
-        if isinstance(aspect, DatasetPropertiesClass)
-    )
-
-    assert props_aspect.customProperties.get("partition_path", "").endswith(
-        "year=2024/month=12/day=27"
-    )
-    assert json.loads(props_aspect.customProperties["partition_values"]) == {
-        "year": "2024",
-        "month": "12",
-        "day": "27",
+@pytest.mark.parametrize(
+    "source_root,cron,run_timestamp,expect_partition",
+    [
+        (_PARTITION_ROOT, "0 2 * * *", "2024-12-27T00:30:00Z", True),
+        # Cron is informational only: an invalid value is recorded but ignored.
+        (_PARTITION_ROOT, "invalid cron", "2024-12-27T00:30:00Z", True),
+        # Format present but no timestamp: fall back to the base path.
+        (_SAMPLE_CSV_ROOT, None, None, False),
+    ],
+    ids=["resolved_partition", "invalid_cron_ignored", "no_timestamp_base_path"],
+)
+def test_ingestion_partition_metadata(
+    tmp_path,
+    capturing_platform,
+    dummy_config_manager,
+    source_root,
+    cron,
+    run_timestamp,
+    expect_partition,
+) -> None:
+    source = {
+        "source_type": "csv",
+        "source_path": str(source_root),
+        "partitioning_format": "year=%Y/month=%m/day=%d",
+        "infer_schema": True,
+        "schema": {},
     }
-
-
-def test_invalid_cron_is_preserved_but_ignored(tmp_path) -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    partition_root = repo_root / "sample-data-csv" / "partitioned" / "categories"
-
-    config = [
-        {
-            "source_type": "csv",
-            "source_path": str(partition_root),
-            "partitioning_format": "year=%Y/month=%m/day=%d",
-            "partition_cron": "invalid cron",  # informational only
-            "infer_schema": True,
-            "schema": {},
-        }
-    ]
+    if cron is not None:
+        source["partition_cron"] = cron
     config_path = tmp_path / "ingestion.json"
-    config_path.write_text(json.dumps(config), encoding="utf-8")
-
-    platform_handler = MagicMock()
-    service = IngestionService(_mock_config_manager(), platform_handler)
-
-    service.start_ingestion(str(config_path), run_timestamp="2024-12-27T00:30:00Z")
-
-    emitted_mce = platform_handler.emit_mce.call_args[0][0]
-    props_aspect = next(
-        aspect
-        for aspect in emitted_mce.proposedSnapshot.aspects
-        if isinstance(aspect, DatasetPropertiesClass)
-    )
-
-    # Partition path follows the timestamp directly
-    assert props_aspect.customProperties.get("partition_path", "").endswith(
-        "year=2024/month=12/day=27"
-    )
-    # Cron value is recorded but does not affect selection
-    assert props_aspect.customProperties.get("partition_cron") == "invalid cron"
-
-
-def test_partition_format_without_timestamp_falls_back_to_base_path(tmp_path) -> None:
-    """When partitioning_format is configured but no timestamp provided, use base path."""
-    repo_root = Path(__file__).resolve().parents[2]
-    # Use non-partitioned sample data since we're testing fallback behavior
-    base_path = repo_root / "sample-data-csv"
-
-    config = [
-        {
-            "source_type": "csv",
-            "source_path": str(base_path),
-            "partitioning_format": "year=%Y/month=%m/day=%d",  # Format present
-            "infer_schema": True,
-            "schema": {},
+    with config_path.open("w", encoding="utf-8") as f:
+        json.dump([source], f)
+
+    service = IngestionService(dummy_config_manager, capturing_platform)
+    service.start_ingestion(str(config_path), run_timestamp=run_timestamp)
+
+    assert capturing_platform.mces
+    custom_properties = _aspect(
+        capturing_platform.mces[-1], DatasetPropertiesClass
+    ).customProperties
+
+    if expect_partition:
+        # Partition path follows the timestamp directly
+        assert custom_properties.get("partition_path", "").endswith("year=2024/month=12/day=27")
+        assert json.loads(custom_properties["partition_values"]) == {
+            "year": "2024",
+            "month": "12",
+            "day": "27",
         }
-    ]
-    config_path = tmp_path / "ingestion.json"
-    config_path.write_text(json.dumps(config), encoding="utf-8")
+        assert custom_properties.get("partition_cron") == cron
+    else:
+        assert "partition_path" not in custom_properties
+        assert "partition_values" not in custom_properties
 
-    platform_handler = MagicMock()
-    service = IngestionService(_mock_config_manager(), platform_handler)
 
-    # Call WITHOUT timestamp - should fall back to base path
-    service.start_ingestion(str(config_path), run_timestamp=None)
-
-    # Should still ingest files from base path
-    platform_handler.emit_mce.assert_called()
-
-    # Verify partition metadata is NOT present (fallback behavior)
-    emitted_mce = platform_handler.emit_mce.call_args[0][0]
-    props_aspect = next(
-        aspect
-        for aspect in emitted_mce.proposedSnapshot.aspects
-        if isinstance(aspect, DatasetPropertiesClass)
-    )
-
-    # No partition metadata should be present in fallback mode
-    assert "partition_path" not in props_aspect.customProperties
-    assert "partition_values" not in props_aspect.customProperties
-
-
-def test_s3_partition_format_without_timestamp_uses_base_path(tmp_path) -> None:
+def test_s3_partition_format_without_timestamp_uses_base_path(
+    tmp_path, dummy_config_manager
+) -> None:
     """S3 configs with partitioning_format but no timestamp should use base path, not append raw format."""
     from unittest.mock import patch
     
@@ -167,23 +105,31 @@ def test_s3_partition_format_without_timestamp_uses_base_path(tmp_path) -> None:
         }
     ]
     config_path = tmp_path / "s3_ingestion.json"
-    config_path.write_text(json.dumps(config), encoding="utf-8")
+    with config_path.open("w", encoding="utf-8") as f:
+        json.dump(config, f)
 
     platform_handler = MagicMock()
-    service = IngestionService(_mock_config_manager(), platform_handler)
+    service = IngestionService(dummy_config_manager, platform_handler)
 
     # Mock the S3 handler to avoid boto3 initialization
     mock_handler = MagicMock()
     mock_mce = MagicMock()
     mock_handler.ingest.return_value = mock_mce
-    
-    with patch("feature.ingestion.handlers.factory.HandlerFactory.get_handler", return_value=mock_handler):
+    seen_source_paths = []
+
+    def _get_handler(cfg):
+        # Record rather than assert here: start_ingestion swallows per-config errors.
+        seen_source_paths.append(cfg["source"]["source_path"])
+        return mock_handler
+
+    with patch(
+        "feature.ingestion.handlers.factory.HandlerFactory.get_handler", side_effect=_get_handler
+    ):
         # Call WITHOUT timestamp - should use base path, NOT s3://test-bucket/data/table/year=%Y/month=%m/day=%d
         service.start_ingestion(str(config_path), run_timestamp=None)
 
-    # Verify handler was called with base path (not with appended raw format)
-    # The key check: source_path in the config should be the base path
-    call_config = mock_handler.ingest.call_args
+    # Verify handler was built for the base path (not with appended raw format)
+    assert seen_source_paths == ["s3://test-bucket/data/table"]
     assert mock_handler.ingest.called, "Handler ingest should have been called"
     
     # Verify the platform handler received the MCE
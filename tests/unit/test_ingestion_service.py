@@ -0,0 +1,163 @@
+"""Unit tests for IngestionService."""
+from __future__ import annotations
+
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, mock_open
+
+import pytest
+
+from feature.ingestion import ingestion_service as mod
+
+
+@pytest.fixture(scope="module")
+def _module_service(dummy_config_manager):
+    """One IngestionService per module; none of these tests read real config."""
+    return mod.IngestionService(
+        config_manager=dummy_config_manager,
+        platform_handler=MagicMock(),
+    )
+
+
+@pytest.fixture
+def shared_ingestion_service(_module_service):
+    """The module's service with a fresh platform handler for each test."""
+    _module_service.platform_handler = MagicMock()
+    return _module_service
+
+
+@pytest.fixture(scope="module")
+def sample_csv(tmp_path_factory):
+    """A tiny CSV written once and shared by every test in this module."""
+    path = tmp_path_factory.mktemp("csv") / "a.csv"
+    path.write_text("id\n1\n")
+    return path
+
+
+def _patch_handler(monkeypatch, mce):
+    """Route HandlerFactory.get_handler to a stub whose ingest() returns ``mce``."""
+    handler = MagicMock()
+    handler.ingest.return_value = mce
+    get_handler = MagicMock(return_value=handler)
+    monkeypatch.setattr(mod, "HandlerFactory", SimpleNamespace(get_handler=get_handler))
+    return get_handler
+
+
+@pytest.mark.parametrize(
+    "bad_cfg",
+    [
+        {},
+        {"source_type": "csv", "source_path": "/tmp/x.csv", "delimiter": "::"},
+        {"source_type": "csv"},
+    ],
+    ids=["no_type", "bad_delim", "no_path"],
+)
+def test_validate_source_config_rejects_invalid(shared_ingestion_service, bad_cfg) -> None:
+    with pytest.raises(ValueError):
+        shared_ingestion_service._validate_source_config(bad_cfg)
+
+
+def test_validate_source_config_accepts_minimal_csv(shared_ingestion_service) -> None:
+    shared_ingestion_service._validate_source_config(
+        {"source_type": "csv", "source_path": "/tmp/x.csv"}
+    )
+
+
+def test_process_file_emits_mce_when_handler_returns_mce(
+    shared_ingestion_service, monkeypatch, sample_csv
+) -> None:
+    mce = object()
+    get_handler = _patch_handler(monkeypatch, mce)
+
+    shared_ingestion_service._process_file({"source": {}}, str(sample_csv), sample_csv.name)
+
+    file_config = get_handler.call_args[0][0]
+    assert file_config["source"]["path"] == str(sample_csv)
+    assert file_config["source"]["dataset_name"] == "a"
+    shared_ingestion_service.platform_handler.emit_mce.assert_called_once_with(mce)
+
+
+def test_process_file_does_not_emit_when_no_mce(
+    shared_ingestion_service, monkeypatch, sample_csv
+) -> None:
+    _patch_handler(monkeypatch, None)
+
+    shared_ingestion_service._process_file({"source": {}}, str(sample_csv), sample_csv.name)
+
+    shared_ingestion_service.platform_handler.emit_mce.assert_not_called()
+
+
+def test_process_file_based_config_single_file_sets_dataset_name(
+    shared_ingestion_service, monkeypatch, sample_csv
+) -> None:
+    mce = object()
+    get_handler = _patch_handler(monkeypatch, mce)
+    config = {"source": {}}
+
+    shared_ingestion_service._process_file_based_config(config, str(sample_csv), "csv")
+
+    assert get_handler.call_args[0][0]["source"]["dataset_name"] == "a"
+    shared_ingestion_service.platform_handler.emit_mce.assert_called_once_with(mce)
+
+
+def test_process_file_based_config_directory_processes_matching_files(
+    shared_ingestion_service, monkeypatch, sample_csv
+) -> None:
+    _patch_handler(monkeypatch, object())
+
+    shared_ingestion_service._process_file_based_config(
+        {"source": {}}, str(sample_csv.parent), "csv"
+    )
+
+    assert shared_ingestion_service.platform_handler.emit_mce.call_count == 1
+
+
+def test_start_ingestion_processes_list_configs_and_continues_on_error(
+    shared_ingestion_service, monkeypatch
+) -> None:
+    fake_data = [
+        {"source_type": "csv", "source_path": "/tmp/missing.csv"},
+        {"source_type": "s3", "source_path": "s3://bucket/key"},
+    ]
+    # Serve the config from memory instead of a file on disk.
+    monkeypatch.setattr(mod, "open", mock_open(), raising=False)
+    monkeypatch.setattr(
+        mod,
+        "json",
+        SimpleNamespace(load=lambda _fh: fake_data, JSONDecodeError=json.JSONDecodeError),
+    )
+    mce = object()
+    get_handler = _patch_handler(monkeypatch, mce)
+
+    shared_ingestion_service.start_ingestion("configs.json")
+
+    # The missing CSV fails path verification; the S3 config still runs.
+    get_handler.assert_called_once()
+    shared_ingestion_service.platform_handler.emit_mce.assert_called_once_with(mce)
+
+
+@pytest.mark.parametrize(
+    "cfg_fixture,failed",
+    [("single_bad_cfg", 1), ("multi_bad_cfg", 2)],
+    ids=["single", "multiple"],
+)
+def test_start_ingestion_logs_failed_configs_without_raising(
+    shared_ingestion_service, request, caplog, cfg_fixture, failed
+) -> None:
+    config_path = request.getfixturevalue(cfg_fixture)
+
+    with caplog.at_level(logging.ERROR, logger=mod.__name__):
+        shared_ingestion_service.start_ingestion(config_path)
+
+    messages = [r.getMessage() for r in caplog.records]
+    for i in range(1, failed + 1):
+        assert any(m.startswith(f"Failed to process configuration {i}:") for m in messages)
+    shared_ingestion_service.platform_handler.emit_mce.assert_not_called()
+
+
+@pytest.mark.parametrize("exists", [False, True], ids=["missing", "existing"])
+def test_verify_path_exists(shared_ingestion_service, monkeypatch, exists) -> None:
+    monkeypatch.setattr(mod.os.path, "exists", lambda _path: exists)
+
+    assert shared_ingestion_service._verify_path_exists("/anything") is exists
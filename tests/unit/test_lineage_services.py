@@ -1,8 +1,33 @@
 """Unit tests for lineage services."""
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import MagicMock
+from unittest import mock
+
+from _platform_doubles import CapturingPlatform
+from feature.lineage import dataset_lineage_service as dataset_lineage_mod
+from feature.lineage.data_job_service import DataJobService
+from feature.lineage.dataset_lineage_service import DatasetLineageService
+
+# Incomplete lineage configs; read-only, so shared across parametrized cases.
+_CFG_NO_KEY = MappingProxyType({"not_lineage": {}})
+_CFG_NO_DOWN = MappingProxyType(
+    {"lineage": MappingProxyType({"upstreams": ({"data_type": "csv", "dataset": "source"},)})}
+)
+
+
+@pytest.fixture(scope="module")
+def lineage_service(dummy_config_manager):
+    """A DatasetLineageService shared by tests that do not emit anything."""
+    return DatasetLineageService(CapturingPlatform({}), dummy_config_manager)
+
+
+@pytest.fixture
+def lineage_ctx(capturing_platform, dummy_config_manager):
+    """A recording platform and a DatasetLineageService wired to it."""
+    return capturing_platform, DatasetLineageService(capturing_platform, dummy_config_manager)
 
 
 class TestDatasetLineageService:
@@ -10,84 +35,92 @@ class TestDatasetLineageService:
     
     def test_dataset_lineage_service_import(self) -> None:
         """Test that DatasetLineageService can be imported."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
         assert DatasetLineageService is not None
     
-    def test_dataset_lineage_service_initialization(self) -> None:
+    def test_dataset_lineage_service_initialization(
+        self, lineage_service, dummy_config_manager
+    ) -> None:
         """Test DatasetLineageService initialization."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DatasetLineageService(mock_handler, mock_config_manager)
-        assert service.platform_handler == mock_handler
-        assert service.config_manager == mock_config_manager
+        service = lineage_service
+        assert isinstance(service.platform_handler, CapturingPlatform)
+        assert service.config_manager == dummy_config_manager
         assert service.env == "DEV"
     
-    def test_dataset_lineage_service_build_urn(self) -> None:
+    def test_dataset_lineage_service_build_urn(self, lineage_service) -> None:
         """Test URN building for lineage."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DatasetLineageService(mock_handler, mock_config_manager)
+        service = lineage_service
         urn = service._build_urn("csv", "test_dataset")
         
         assert "csv" in urn
         assert "test_dataset" in urn
         assert "DEV" in urn
     
-    def test_dataset_lineage_service_build_urn_requires_both_params(self) -> None:
+    def test_dataset_lineage_service_build_urn_reuses_built_urns(self, lineage_ctx) -> None:
+        """Test _build_urn only calls make_dataset_urn once per dataset."""
+        _, service = lineage_ctx
+        with mock.patch.object(
+            dataset_lineage_mod, "make_dataset_urn", wraps=dataset_lineage_mod.make_dataset_urn
+        ) as make_urn:
+            first = service._build_urn("csv", "test_dataset")
+            assert service._build_urn("csv", "test_dataset") == first
+            service._build_urn("csv", "other_dataset")
+
+        assert make_urn.call_count == 2
+
+    @pytest.mark.parametrize(
+        "data_type,dataset", [("", "test_dataset"), ("csv", "")], ids=["no_data_type", "no_dataset"]
+    )
+    def test_dataset_lineage_service_build_urn_requires_both_params(
+        self, lineage_service, data_type, dataset
+    ) -> None:
         """Test that _build_urn requires both data_type and dataset_name."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DatasetLineageService(mock_handler, mock_config_manager)
-        
-        with pytest.raises(ValueError):
-            service._build_urn("", "test_dataset")
-        
-        with pytest.raises(ValueError):
-            service._build_urn("csv", "")
-    
-    def test_dataset_lineage_service_add_lineage_from_config_missing_key(self) -> None:
-        """Test add_lineage_from_config returns False when lineage key is missing."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DatasetLineageService(mock_handler, mock_config_manager)
-        
-        config = {"not_lineage": {}}
-        result = service.add_lineage_from_config(config)
-        assert result is False
-    
-    def test_dataset_lineage_service_add_lineage_from_config_missing_downstream(self) -> None:
-        """Test add_lineage_from_config returns False when downstream is missing."""
-        from feature.lineage.dataset_lineage_service import DatasetLineageService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DatasetLineageService(mock_handler, mock_config_manager)
-        
+        with pytest.raises(ValueError, match="Both 'data_type' and 'dataset' must be provided"):
+            lineage_service._build_urn(data_type, dataset)
+
+    @pytest.mark.parametrize(
+        "config",
+        [_CFG_NO_KEY, _CFG_NO_DOWN],
+        ids=["missing_key", "missing_downstream"],
+    )
+    def test_dataset_lineage_service_add_lineage_from_config_rejects_incomplete(
+        self, lineage_service, config
+    ) -> None:
+        """Test add_lineage_from_config returns False without a lineage key or downstream."""
+        assert lineage_service.add_lineage_from_config(config) is False
+
+    def test_add_lineage_from_config_happy_path_calls_platform_handler(self, lineage_ctx) -> None:
+        """Test add_lineage_from_config emits table and column lineage."""
+        platform, service = lineage_ctx
+
         config = {
             "lineage": {
-                "upstreams": [{"data_type": "csv", "dataset": "source"}]
+                "downstream": {"data_type": "csv", "dataset": "target"},
+                "upstreams": [{"data_type": "csv", "dataset": "source"}],
+                "column_lineage": [
+                    {
+                        "source": {"data_type": "csv", "dataset": "source", "field": "id"},
+                        "target": {"data_type": "csv", "dataset": "target", "field": "id"},
+                    }
+                ],
             }
         }
-        result = service.add_lineage_from_config(config)
-        assert result is False
+
+        with mock.patch.multiple(
+            dataset_lineage_mod,
+            make_dataset_urn=lambda p, n, e: f"urn:{p}:{n}:{e}",
+            make_schema_field_urn=lambda d, f: f"{d}::{f}",
+            FineGrainedLineage=lambda **k: ("FGL", k),
+            Upstream=lambda **k: ("UP", k),
+            UpstreamLineage=lambda **k: ("UL", k),
+            MetadataChangeProposalWrapper=lambda **k: ("MCP", k),
+        ):
+            result = service.add_lineage_from_config(config)
+
+        assert result is True
+        assert platform.lineage == [("urn:csv:source:DEV", "urn:csv:target:DEV")]
+        (kind, mcp), = platform.mcps
+        assert kind == "MCP"
+        assert mcp["entityUrn"] == "urn:csv:target:DEV"
 
 
 class TestDataJobService:
@@ -95,18 +128,13 @@ class TestDataJobService:
     
     def test_data_job_service_import(self) -> None:
         """Test that DataJobService can be imported."""
-        from feature.lineage.data_job_service import DataJobService
         assert DataJobService is not None
     
-    def test_data_job_service_initialization(self) -> None:
+    def test_data_job_service_initialization(
+        self, capturing_platform, dummy_config_manager
+    ) -> None:
         """Test DataJobService initialization."""
-        from feature.lineage.data_job_service import DataJobService
-        
-        mock_handler = MagicMock()
-        mock_config_manager = MagicMock()
-        mock_config_manager.get_global_config.return_value = {"default_env": "DEV"}
-        
-        service = DataJobService(mock_handler, mock_config_manager)
-        assert service.platform_handler == mock_handler
-        assert service.config_manager == mock_config_manager
+        service = DataJobService(capturing_platform, dummy_config_manager)
+        assert service.platform_handler == capturing_platform
+        assert service.config_manager == dummy_config_manager
 
@@ -0,0 +1,76 @@
+"""Unit tests for OwnershipService."""
+from __future__ import annotations
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+from datahub.emitter.rest_emitter import DatahubRestEmitter
+
+from core.platform.interface import MetadataPlatformInterface
+from feature.ownership import ownership_service as mod
+
+
+@pytest.fixture(scope="module")
+def _ownership_template(dummy_config_manager):
+    """Build one OwnershipService per module with the REST emitter stubbed out."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mod, "DataHubRestEmitter", Mock(spec=DatahubRestEmitter))
+        yield mod.OwnershipService(Mock(spec=MetadataPlatformInterface), dummy_config_manager)
+
+
+@pytest.fixture
+def service(_ownership_template):
+    """Shallow copy of the template with a fresh emitter for each test."""
+    svc = copy.copy(_ownership_template)
+    svc.emitter = Mock(spec=DatahubRestEmitter)
+    return svc
+
+
+def test_generate_user_urn_valid_and_invalid(service) -> None:
+    assert service._generate_user_urn(" alice ") == "urn:li:corpuser:alice"
+    with pytest.raises(ValueError):
+        service._generate_user_urn("  ")
+
+
+def test_generate_entity_urn_uses_service_env(service) -> None:
+    urn = service._generate_entity_urn({"datatype": "CSV", "dataset_name": "orders"})
+    assert urn == "urn:li:dataset:(urn:li:dataPlatform:csv,orders,DEV)"
+
+
+def test_create_user_emits_info_aspect(service) -> None:
+    assert service.create_user({"username": "alice"}) is True
+    service.emitter.emit.assert_called_once()
+
+
+@pytest.fixture
+def batch_data(monkeypatch):
+    """Pre-built batch payloads served by a stubbed load_json_file."""
+    data = {
+        "users": [{"username": "u1"}, {}],
+        "groups": [{"name": "g1"}],
+        "assignments": [
+            {"owner_name": "u1", "entity": {"datatype": "csv", "dataset_name": "orders"}}
+        ],
+    }
+    monkeypatch.setattr(mod, "load_json_file", lambda _path, kind: data[kind])
+    return data
+
+
+def test_process_batch_operations_counts_results(service, batch_data) -> None:
+    results = service.process_batch_operations(
+        {"users_file": "u.json", "groups_file": "g.json", "assignments_file": "a.json"}
+    )
+
+    assert results["users"] == {"successful": 1, "failed": 1, "total": 2}
+    assert results["groups"] == {"successful": 1, "failed": 0, "total": 1}
+    assert results["assignments"] == {"successful": 1, "failed": 0, "total": 1}
+
+
+def test_process_batch_operations_skips_unconfigured_files(service, batch_data) -> None:
+    results = service.process_batch_operations({"groups_file": "g.json"})
+
+    assert results["users"]["total"] == 0
+    assert results["groups"] == {"successful": 1, "failed": 0, "total": 1}
+    assert results["assignments"]["total"] == 0
+    service.emitter.emit.assert_called_once()
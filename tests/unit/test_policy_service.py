@@ -0,0 +1,8 @@
+"""Unit tests for PolicyService."""
+from __future__ import annotations
+
+from feature.rbac.policy_service import PolicyService
+
+
+def test_apply_policy_returns_message() -> None:
+    assert PolicyService().apply_policy({"name": "test"}) == "Applying policy: {'name': 'test'}"
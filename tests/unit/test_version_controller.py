@@ -0,0 +1,57 @@
+"""Unit tests for the version controller."""
+from __future__ import annotations
+
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.controllers import version_controller as mod
+
+
+_Dataset = namedtuple("_Dataset", "urn name platform")
+
+
+_DATASETS = [
+    _Dataset("urn:a", "a", "csv"),
+    _Dataset("urn:b", "b", "csv"),
+    _Dataset("urn:c", "c", "avro"),
+]
+
+
+@pytest.fixture
+def scanner(monkeypatch):
+    """DatasetScanner stub returning the canned datasets; ConfigManager is stubbed out too."""
+    scanner = MagicMock()
+    scanner.scan_all_datasets.return_value = list(_DATASETS)
+    scanner.get_platform_summary.return_value = {"csv": 2, "avro": 1}
+    monkeypatch.setattr(mod, "ConfigManager", MagicMock())
+    monkeypatch.setattr(mod, "DatasetScanner", MagicMock(return_value=scanner))
+    return scanner
+
+
+def test_run_dataset_scan_returns_summary(scanner) -> None:
+    summary = mod.run_dataset_scan()
+
+    assert summary == {"total": 3, "platforms": {"csv": 2, "avro": 1}}
+
+
+def test_run_dataset_scan_returns_empty_summary_when_no_datasets(scanner) -> None:
+    scanner.scan_all_datasets.return_value = []
+
+    assert mod.run_dataset_scan() == {"total": 0, "platforms": {}}
+
+
+def test_run_version_update_counts_results(scanner, monkeypatch) -> None:
+    manager = MagicMock()
+    manager.bulk_update_versions.return_value = [
+        MagicMock(success=True),
+        MagicMock(success=False),
+        MagicMock(success=True),
+    ]
+    monkeypatch.setattr(mod, "VersionManager", MagicMock(return_value=manager))
+
+    summary = mod.run_version_update()
+
+    manager.bulk_update_versions.assert_called_once_with(["urn:a", "urn:b", "urn:c"])
+    assert summary == {"total": 3, "succeeded": 2, "failed": 1}
@@ -0,0 +1,50 @@
+"""Unit tests for VersionManager."""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from feature.versioning import version_service as mod
+
+
+@pytest.fixture(scope="module")
+def mgr(dummy_config_manager):
+    """Build one VersionManager per module; tests must not mutate it."""
+    return mod.VersionManager(dummy_config_manager)
+
+
+@pytest.mark.parametrize(
+    "version,ok",
+    [("S-1", True), ("S-311", True), ("X-1", False), ("S-", False)],
+)
+def test_validate_cloud_version(mgr, version, ok) -> None:
+    assert mgr.validate_cloud_version(version) is ok
+
+
+def test_parse_cloud_version_invalid_raises(mgr) -> None:
+    with pytest.raises(ValueError):
+        mgr.parse_cloud_version("bad")
+
+
+def test_increment_cloud_version(mgr) -> None:
+    assert mgr.increment_cloud_version("S-311") == "S-312"
+
+
+def test_increment_schema_version_major_only(mgr) -> None:
+    assert mgr.increment_schema_version("1.4.2") == "2.0.0"
+
+
+def test_get_latest_versions_picks_highest_cloud_version(mgr) -> None:
+    mapping = {"S-311": "1.0.0", "S-313": "3.0.0", "S-312": "2.0.0"}
+    assert mgr.get_latest_versions(mapping) == ("S-313", "3.0.0")
+
+
+def test_get_current_version_mapping_parses_custom_properties(mgr, gms) -> None:
+    assert mgr.get_current_version_mapping("urn:li:dataset:x") == {"S-311": "1.0.0"}
+    assert gms.last_request.qs == {"aspects": ["datasetproperties"]}
+
+
+def test_get_current_version_mapping_empty_on_http_error(mgr, gms) -> None:
+    gms.get(re.compile(r".*"), status_code=404)
+    assert mgr.get_current_version_mapping("urn:li:dataset:x") == {}